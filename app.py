@@ -13,8 +13,15 @@ Features:
 import streamlit as st
 import pyarrow.parquet as pq
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pandas as pd
-import io
+import numpy as np
+import pyarrow.fs as pafs
+import os
+import atexit
+import hashlib
+import tempfile
 
 
 # Page configuration
@@ -26,155 +33,302 @@ st.set_page_config(
 )
 
 # Default constants for performance
-DEFAULT_MAX_ROWS_FULL_LOAD = 100000  # Only load all data if less than this
 DEFAULT_PAGE_SIZE = 25
 
 
 def initialize_session_state():
     """Initialize session state variables if they don't exist."""
     defaults = {
-        "uploaded_file": None,
-        "parquet_file": None,
+        "file_name": None,
+        "file_size": 0,
+        "file_id": None,  # Streamlit upload id, to detect a new upload without hashing
+        "file_digest": None,
+        "file_path": None,  # Uploaded bytes spilled to disk for memory mapping
         "total_rows": 0,
         "num_row_groups": 0,
         "columns": [],
+        "row_group_offsets": None,
+        "total_byte_size": 0,  # Sum of row group sizes, for the metadata tab
         "filter_column": None,
         "filter_value": "",
         "page_size": DEFAULT_PAGE_SIZE,
         "current_page": 1,
         "selected_columns": None,  # For column pruning
-        "max_rows_full_load": DEFAULT_MAX_ROWS_FULL_LOAD,
     }
     for key, value in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = value
 
 
-def load_parquet_metadata(uploaded_file) -> tuple[pq.ParquetFile, int, int, list] | tuple[None, None, None, None]:
+def compute_row_group_offsets(metadata: pq.FileMetaData) -> np.ndarray:
+    """
+    Compute the cumulative starting row of each row group.
+    
+    Args:
+        metadata: PyArrow FileMetaData object
+        
+    Returns:
+        int64 array of length num_row_groups + 1, where row group i covers
+        rows offsets[i] to offsets[i + 1]
+    """
+    row_counts = [metadata.row_group(rg_idx).num_rows for rg_idx in range(metadata.num_row_groups)]
+    offsets = np.zeros(len(row_counts) + 1, dtype=np.int64)
+    np.cumsum(row_counts, out=offsets[1:])
+    return offsets
+
+
+@st.cache_data(show_spinner=False)
+def _load_metadata_cached(file_digest: str, _data: memoryview) -> tuple[int, int, list, np.ndarray, int]:
+    """
+    Decode the parquet footer once per distinct file and cache the results.
+    
+    Args:
+        file_digest: Digest of the uploaded file, used as the cache key
+        _data: Raw bytes of the uploaded parquet file (not hashed)
+        
+    Returns:
+        Tuple of (total_rows, num_row_groups, columns, row_group_offsets, total_byte_size)
+    """
+    parquet_file = pq.ParquetFile(pa.BufferReader(pa.py_buffer(_data)))
+    metadata = parquet_file.metadata
+    
+    # Use schema_arrow.fields which returns a list of fields
+    columns = [field.name for field in parquet_file.schema_arrow]
+    row_group_offsets = compute_row_group_offsets(metadata)
+    total_byte_size = sum(
+        metadata.row_group(rg_idx).total_byte_size for rg_idx in range(metadata.num_row_groups)
+    )
+    
+    return metadata.num_rows, metadata.num_row_groups, columns, row_group_offsets, total_byte_size
+
+
+def _remove_file(path: str) -> bool:
+    """
+    Delete a file, ignoring errors (e.g. it is still memory-mapped on Windows).
+    
+    Returns:
+        True if the file is gone
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+@st.cache_resource
+def _spilled_upload_paths() -> set[str]:
+    """Process-wide set of temp files created for uploads, removed at exit."""
+    paths = set()
+
+    def remove_all():
+        for path in list(paths):
+            _remove_file(path)
+
+    atexit.register(remove_all)
+    return paths
+
+
+def spill_upload_to_disk(uploaded_file) -> str:
+    """
+    Write an uploaded file to a temp file so it can be memory-mapped.
+    
+    Args:
+        uploaded_file: The file object from st.file_uploader
+        
+    Returns:
+        Path of the temp file
+    """
+    with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
+        tmp.write(uploaded_file.getbuffer())
+    
+    _spilled_upload_paths().add(tmp.name)
+    return tmp.name
+
+
+def release_spilled_upload(digest: str, path: str):
+    """
+    Evict the cached handles for an upload and delete its temp file.
+    
+    The handles are evicted first so the file is no longer mapped by this
+    app when it is removed. If removal still fails (another reader has it
+    mapped on Windows), the path stays registered and is retried at exit.
+    
+    Args:
+        digest: BLAKE2b digest of the file contents
+        path: Temp file holding the upload
+    """
+    get_parquet_file.clear(digest, path)
+    get_parquet_dataset.clear(digest, path)
+    
+    if _remove_file(path):
+        _spilled_upload_paths().discard(path)
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_parquet_file(digest: str, _path: str) -> pq.ParquetFile:
+    """
+    Open a memory-mapped ParquetFile once per upload and share it across reruns.
+    
+    Args:
+        digest: BLAKE2b digest of the file contents, used as the cache key
+        _path: Temp file holding the upload (not hashed)
+        
+    Returns:
+        PyArrow ParquetFile object
+    """
+    return pq.ParquetFile(pa.memory_map(_path, "r"), pre_buffer=True)
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_parquet_dataset(digest: str, _path: str) -> ds.Dataset:
+    """
+    Wrap an upload in a PyArrow dataset so row group statistics can be
+    checked against filter expressions.
+    
+    Args:
+        digest: BLAKE2b digest of the file contents, used as the cache key
+        _path: Temp file holding the upload (not hashed)
+        
+    Returns:
+        Single-file PyArrow dataset
+    """
+    return ds.dataset(
+        _path,
+        format="parquet",
+        filesystem=pafs.LocalFileSystem(use_mmap=True)
+    )
+
+
+def get_active_parquet_file() -> pq.ParquetFile | None:
+    """Return the cached ParquetFile for the current upload, if any."""
+    if st.session_state.file_digest is None or st.session_state.file_path is None:
+        return None
+    
+    return get_parquet_file(st.session_state.file_digest, st.session_state.file_path)
+
+
+def load_parquet_metadata(uploaded_file) -> tuple[str, int, int, list, np.ndarray, int] | tuple[None, None, None, None, None, None]:
     """
     Load only metadata from parquet file without reading all data.
     
+    The upload is hashed in place with BLAKE2b-128, and metadata is served
+    from cache for files that were seen before.
+    
     Args:
         uploaded_file: The file object from st.file_uploader
         
     Returns:
-        Tuple of (ParquetFile, total_rows, num_row_groups, columns) or Nones if error
+        Tuple of (file_digest, total_rows, num_row_groups, columns, row_group_offsets,
+        total_byte_size) or Nones if error
     """
     try:
-        bytes_data = uploaded_file.getvalue()
-        parquet_file = pq.ParquetFile(io.BytesIO(bytes_data))
-        metadata = parquet_file.metadata
-        
-        total_rows = metadata.num_rows
-        num_row_groups = metadata.num_row_groups
-        # Use schema_arrow.fields which returns a list of fields
-        columns = [field.name for field in parquet_file.schema_arrow]
+        data = uploaded_file.getbuffer()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        total_rows, num_row_groups, columns, row_group_offsets, total_byte_size = _load_metadata_cached(digest, data)
         
-        return parquet_file, total_rows, num_row_groups, columns
+        return digest, total_rows, num_row_groups, columns, row_group_offsets, total_byte_size
     except Exception as e:
         st.error(f"Error loading parquet file: {str(e)}")
-        return None, None, None, None
+        return None, None, None, None, None, None
 
 
-def read_page_efficiently(parquet_file: pq.ParquetFile, page: int, page_size: int, 
-                          columns: list | None = None) -> pd.DataFrame:
+@st.cache_data(max_entries=64, show_spinner=False)
+def read_page_efficiently(file_digest: str, _path: str, page: int, page_size: int,
+                          columns: tuple | None = None,
+                          _row_group_offsets: np.ndarray | None = None) -> pa.Table:
     """
     Read only the rows needed for the current page using row group filtering.
     For large files, this avoids loading entire dataset into memory.
     
+    Pages are cached per file digest, so navigating back and forth does not
+    decode the same row groups again. The page is returned as a compact Arrow
+    table, which st.dataframe serializes directly without a pandas round-trip.
+    
     Args:
-        parquet_file: PyArrow ParquetFile object
+        file_digest: Digest of the uploaded file, used as the cache key
+        _path: Temp file holding the upload (not hashed)
         page: Current page number (1-indexed)
         page_size: Number of rows per page
-        columns: List of columns to read (None = all columns)
+        columns: Tuple of columns to read (None = all columns)
+        _row_group_offsets: Precomputed cumulative row group offsets
+            (None = compute from metadata)
         
     Returns:
-        DataFrame with paginated data
+        Arrow table with paginated data
     """
-    try:
-        total_rows = parquet_file.metadata.num_rows
-        start_row = (page - 1) * page_size
-        end_row = min(start_row + page_size, total_rows)
-        
-        # For small files or if we need all columns, read specific row range
-        if total_rows <= st.session_state.max_rows_full_load:
-            # Read all data and slice (efficient for small files)
-            table = parquet_file.read(columns=columns)
-            df = table.to_pandas()
-            return df.iloc[start_row:end_row]
-        else:
-            # For large files, use row group based reading
-            # Find which row groups contain our target rows
-            row_group_offsets = []
-            current_offset = 0
-            
-            for rg_idx in range(parquet_file.metadata.num_row_groups):
-                rg_metadata = parquet_file.metadata.row_group(rg_idx)
-                num_rows = rg_metadata.num_rows
-                row_group_offsets.append((current_offset, current_offset + num_rows, rg_idx))
-                current_offset += num_rows
-            
-            # Collect row groups that overlap with our page
-            chunks = []
-            for start, end, rg_idx in row_group_offsets:
-                if end > start_row and start < end_row:
-                    # This row group contains rows we need
-                    table = parquet_file.read_row_group(rg_idx, columns=columns)
-                    chunks.append(table.to_pandas())
-            
-            if chunks:
-                df = pd.concat(chunks, ignore_index=True)
-                # Adjust slice to get exact page rows
-                page_start = start_row - row_group_offsets[0][0] if row_group_offsets else 0
-                return df.iloc[page_start:page_start + page_size]
-            else:
-                return pd.DataFrame()
-    except Exception as e:
-        st.error(f"Error reading page: {str(e)}")
-        return pd.DataFrame()
+    parquet_file = get_parquet_file(file_digest, _path)
+    columns = list(columns) if columns is not None else None
+    row_group_offsets = _row_group_offsets
+    
+    total_rows = parquet_file.metadata.num_rows
+    start_row = (page - 1) * page_size
+    end_row = min(start_row + page_size, total_rows)
+    
+    if start_row >= end_row:
+        return pa.table({})
+    
+    if row_group_offsets is None:
+        row_group_offsets = compute_row_group_offsets(parquet_file.metadata)
+    
+    # Binary search for the row groups that overlap with our page
+    start_rg = int(np.searchsorted(row_group_offsets, start_row, side="right")) - 1
+    end_rg = int(np.searchsorted(row_group_offsets, end_row - 1, side="right"))
+    
+    # Read all overlapping row groups in one call so Arrow can decode them in parallel
+    table = parquet_file.read_row_groups(
+        list(range(start_rg, end_rg)), columns=columns, use_threads=True
+    )
+    
+    # Take exactly the page rows into fresh buffers. A zero-copy slice would keep
+    # the whole decoded row groups alive, and st.cache_data would pickle them all.
+    page_start = start_row - int(row_group_offsets[start_rg])
+    return table.take(np.arange(page_start, page_start + (end_row - start_row)))
 
 
-def get_schema_dataframe(parquet_file: pq.ParquetFile) -> pd.DataFrame:
+@st.cache_data(show_spinner=False)
+def get_schema_dataframe(file_digest: str, _parquet_file: pq.ParquetFile) -> pd.DataFrame:
     """
     Extract schema information from a ParquetFile.
     
+    Built column-wise, so wide schemas don't go through a per-field dict.
+    
     Args:
-        parquet_file: PyArrow ParquetFile object
+        file_digest: Digest of the uploaded file, used as the cache key
+        _parquet_file: PyArrow ParquetFile object (not hashed)
         
     Returns:
         DataFrame with columns: Column Name, Data Type, Nullable
     """
-    schema = parquet_file.schema_arrow
-    schema_data = []
+    schema = _parquet_file.schema_arrow
     
-    for field in schema:
-        schema_data.append({
-            "Column Name": field.name,
-            "Data Type": str(field.type),
-            "Nullable": "Yes" if field.nullable else "No"
-        })
-    
-    return pd.DataFrame(schema_data)
+    return pd.DataFrame({
+        "Column Name": [field.name for field in schema],
+        "Data Type": [str(field.type) for field in schema],
+        "Nullable": ["Yes" if field.nullable else "No" for field in schema],
+    })
 
 
-def get_metadata_dict(parquet_file: pq.ParquetFile) -> dict:
+@st.cache_data(show_spinner=False)
+def get_metadata_dict(file_digest: str, _parquet_file: pq.ParquetFile,
+                      total_byte_size: int) -> dict:
     """
     Extract metadata from a ParquetFile.
     
     Args:
-        parquet_file: PyArrow ParquetFile object
+        file_digest: Digest of the uploaded file, used as the cache key
+        _parquet_file: PyArrow ParquetFile object (not hashed)
+        total_byte_size: Sum of row group sizes, precomputed on upload
         
     Returns:
         Dictionary of metadata properties
     """
-    metadata = parquet_file.metadata
+    metadata = _parquet_file.metadata
     
     # Calculate approximate memory usage
-    total_bytes = metadata.serialized_size
-    for rg_idx in range(metadata.num_row_groups):
-        rg = metadata.row_group(rg_idx)
-        total_bytes += rg.total_byte_size
-    
+    total_bytes = metadata.serialized_size + total_byte_size
     size_mb = total_bytes / (1024 * 1024)
     
     return {
@@ -187,28 +341,161 @@ def get_metadata_dict(parquet_file: pq.ParquetFile) -> dict:
     }
 
 
-def paginate_dataframe(df: pd.DataFrame, page: int, page_size: int) -> tuple[pd.DataFrame, int]:
+def build_filter_expression(schema: pa.Schema, column: str, value: str) -> ds.Expression:
     """
-    Paginate a DataFrame.
+    Build a dataset filter expression for the sidebar filter.
+    
+    Text columns use case-insensitive substring matching. Numeric, decimal,
+    date and time columns compare against the value cast once to the column
+    type, so row groups can be skipped using their statistics. Boolean columns match "true" or
+    "false" in any case. Other columns (and values that don't fit the
+    column type) match when Arrow's string representation equals the value.
     
     Args:
-        df: Input DataFrame
+        schema: Arrow schema of the file
+        column: Column to filter on
+        value: Filter value entered by the user
+        
+    Returns:
+        PyArrow dataset expression
+        
+    Raises:
+        ValueError: If the column type has no string representation to
+            compare against (e.g. list or struct columns)
+    """
+    field_type = schema.field(column).type
+    
+    if pa.types.is_string(field_type) or pa.types.is_large_string(field_type):
+        return pc.match_substring(ds.field(column), value, ignore_case=True)
+    
+    if pa.types.is_boolean(field_type) and value.strip().lower() in ("true", "false"):
+        return ds.field(column) == (value.strip().lower() == "true")
+    
+    if (pa.types.is_integer(field_type) or pa.types.is_floating(field_type)
+            or pa.types.is_decimal(field_type) or pa.types.is_temporal(field_type)):
+        try:
+            typed_value = pa.scalar(value).cast(field_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+        else:
+            return ds.field(column) == typed_value
+    
+    # Casting an empty array checks the cast is supported before the file is scanned
+    try:
+        pc.cast(pa.array([], type=field_type), pa.string())
+    except pa.ArrowNotImplementedError:
+        raise ValueError(f"Column '{column}' of type {field_type} can't be filtered")
+    
+    return ds.field(column).cast(pa.string()) == value
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def filter_table(file_digest: str, _path: str, column: str, value: str,
+                 columns: tuple | None = None,
+                 _row_group_offsets: np.ndarray | None = None) -> pa.Table:
+    """
+    Scan the file once for rows matching the sidebar filter.
+    
+    Uses late materialization: row groups whose statistics rule out a match
+    are skipped, the filter column is decoded first to find the matching
+    rows, and the remaining columns are only decoded for row groups that
+    contain at least one match. The filter column is read for the predicate
+    even when it isn't selected, but only the selected columns are returned.
+    Results are cached per file digest, so paginating through them doesn't
+    rescan the file. Arrow tables are immutable, so the result is shared as a
+    resource and pages are sliced from it without copying.
+    
+    Args:
+        file_digest: Digest of the uploaded file, used as the cache key
+        _path: Temp file holding the upload (not hashed)
+        column: Column to filter on
+        value: Filter value entered by the user
+        columns: Tuple of columns to return (None = all columns)
+        _row_group_offsets: Precomputed cumulative row group offsets
+            (None = compute from metadata)
+        
+    Returns:
+        Arrow table with the matching rows
+    """
+    parquet_file = get_parquet_file(file_digest, _path)
+    dataset = get_parquet_dataset(file_digest, _path)
+    row_group_offsets = _row_group_offsets
+    if row_group_offsets is None:
+        row_group_offsets = compute_row_group_offsets(parquet_file.metadata)
+    
+    schema = parquet_file.schema_arrow
+    output_columns = list(columns) if columns is not None else schema.names
+    output_schema = pa.schema([schema.field(name) for name in output_columns])
+    expression = build_filter_expression(schema, column, value)
+    
+    # Row groups that may contain matches according to their statistics
+    fragment = next(iter(dataset.get_fragments()))
+    candidate_rgs = np.array(
+        [rg.id for piece in fragment.split_by_row_group(expression, schema=dataset.schema)
+         for rg in piece.row_groups],
+        dtype=np.int64
+    )
+    if len(candidate_rgs) == 0:
+        return output_schema.empty_table()
+    
+    # Decode only the filter column and find the matching rows
+    candidate_sizes = row_group_offsets[candidate_rgs + 1] - row_group_offsets[candidate_rgs]
+    candidate_offsets = np.zeros(len(candidate_rgs) + 1, dtype=np.int64)
+    np.cumsum(candidate_sizes, out=candidate_offsets[1:])
+    
+    filter_values = parquet_file.read_row_groups(
+        candidate_rgs.tolist(), columns=[column], use_threads=True
+    )
+    row_index = pa.array(np.arange(filter_values.num_rows, dtype=np.int64))
+    matches = filter_values.append_column("__row_index", row_index).filter(expression)
+    indices = matches.column("__row_index").to_numpy()
+    
+    # Decode the other columns only for row groups with matches, then take the matching rows
+    other_columns = [name for name in output_columns if name != column]
+    other_table = None
+    if other_columns and len(indices) > 0:
+        positions = np.searchsorted(candidate_offsets, indices, side="right") - 1
+        needed, needed_positions = np.unique(positions, return_inverse=True)
+        needed_sizes = candidate_sizes[needed]
+        needed_starts = np.concatenate(([0], np.cumsum(needed_sizes)[:-1]))
+        local_indices = indices - candidate_offsets[positions] + needed_starts[needed_positions]
+        
+        other_table = parquet_file.read_row_groups(
+            candidate_rgs[needed].tolist(), columns=other_columns, use_threads=True
+        ).take(pa.array(local_indices))
+    
+    arrays = []
+    for field in output_schema:
+        if field.name == column:
+            arrays.append(matches.column(column))
+        elif other_table is not None:
+            arrays.append(other_table.column(field.name))
+        else:
+            arrays.append(pa.chunked_array([], type=field.type))
+    return pa.Table.from_arrays(arrays, schema=output_schema)
+
+
+def paginate_table(table: pa.Table, page: int, page_size: int) -> tuple[pa.Table, int]:
+    """
+    Paginate an Arrow table without copying it.
+    
+    Args:
+        table: Input Arrow table
         page: Current page number (1-indexed)
         page_size: Number of rows per page
         
     Returns:
-        Tuple of (paginated DataFrame, total pages)
+        Tuple of (paginated Arrow table, total pages)
     """
-    total_rows = len(df)
+    total_rows = table.num_rows
     total_pages = max(1, (total_rows + page_size - 1) // page_size)
     
     # Ensure page is within bounds
     page = max(1, min(page, total_pages))
     
     start_idx = (page - 1) * page_size
-    end_idx = min(start_idx + page_size, total_rows)
     
-    return df.iloc[start_idx:end_idx], total_pages
+    return table.slice(start_idx, page_size), total_pages
 
 
 def reset_to_first_page():
@@ -216,6 +503,15 @@ def reset_to_first_page():
     st.session_state.current_page = 1
 
 
+def clear_filter():
+    """Clear the applied filter and the filter form inputs."""
+    st.session_state.filter_column = None
+    st.session_state.filter_value = ""
+    st.session_state.filter_column_select = None
+    st.session_state.filter_value_input = ""
+    reset_to_first_page()
+
+
 def render_sidebar():
     """Render the sidebar with controls."""
     st.sidebar.header("Controls")
@@ -229,22 +525,41 @@ def render_sidebar():
     )
     
     if uploaded_file is not None:
-        # Load metadata only (fast)
-        parquet_file, total_rows, num_row_groups, columns = load_parquet_metadata(uploaded_file)
-        
-        if parquet_file is not None:
-            st.session_state.parquet_file = parquet_file
-            st.session_state.total_rows = total_rows
-            st.session_state.num_row_groups = num_row_groups
-            st.session_state.columns = columns
-            st.session_state.uploaded_file = uploaded_file
+        # Hash and load metadata only when a new file is uploaded; reruns reuse session state
+        if uploaded_file.file_id != st.session_state.file_id:
+            file_digest, total_rows, num_row_groups, columns, row_group_offsets, total_byte_size = load_parquet_metadata(uploaded_file)
             
+            if file_digest is not None:
+                # Spill each new upload to disk once so reads can be memory-mapped
+                if file_digest != st.session_state.file_digest or st.session_state.file_path is None:
+                    if st.session_state.file_path is not None:
+                        release_spilled_upload(st.session_state.file_digest, st.session_state.file_path)
+                    st.session_state.file_path = spill_upload_to_disk(uploaded_file)
+                
+                # Keep only what identifies the upload, not the UploadedFile and its bytes
+                st.session_state.file_id = uploaded_file.file_id
+                st.session_state.file_name = uploaded_file.name
+                st.session_state.file_size = uploaded_file.size
+                st.session_state.file_digest = file_digest
+                st.session_state.total_rows = total_rows
+                st.session_state.num_row_groups = num_row_groups
+                st.session_state.columns = columns
+                st.session_state.row_group_offsets = row_group_offsets
+                st.session_state.total_byte_size = total_byte_size
+                
+                # The applied filter may name a column the new file doesn't have
+                clear_filter()
+        
+        if uploaded_file.file_id == st.session_state.file_id:
             # Show file info
-            st.sidebar.success(f"Loaded: {uploaded_file.name}")
-            st.sidebar.caption(f"{total_rows:,} rows, {len(columns)} columns")
+            st.sidebar.success(f"Loaded: {st.session_state.file_name}")
+            st.sidebar.caption(
+                f"{st.session_state.total_rows:,} rows, {len(st.session_state.columns)} columns, "
+                f"{st.session_state.file_size / (1024 * 1024):.2f} MB"
+            )
     
     # Only show filter/sort/download if file is loaded
-    if st.session_state.parquet_file is not None:
+    if st.session_state.file_digest is not None:
         columns = st.session_state.columns
         
         st.sidebar.markdown("---")
@@ -261,54 +576,36 @@ def render_sidebar():
         
         st.sidebar.markdown("---")
         
-        # Filtering
+        # Filtering - widgets live in a form so the file is scanned once per Apply,
+        # not on every keystroke
         st.sidebar.subheader("Filter Data")
-        filter_column = st.sidebar.selectbox(
-            "Select column to filter",
-            options=[None] + list(columns),
-            format_func=lambda x: "None" if x is None else x,
-            key="filter_column_select"
-        )
-        st.session_state.filter_column = filter_column
-        
-        if filter_column:
-            filter_value = st.sidebar.text_input(
+        with st.sidebar.form("filter_form"):
+            filter_column = st.selectbox(
+                "Select column to filter",
+                options=[None] + list(columns),
+                format_func=lambda x: "None" if x is None else x,
+                key="filter_column_select"
+            )
+            filter_value = st.text_input(
                 "Filter value",
-                value=st.session_state.filter_value,
+                key="filter_value_input",
                 help="For text columns, partial matching is supported"
             )
-            st.session_state.filter_value = filter_value
-        else:
-            st.session_state.filter_value = ""
+            applied = st.form_submit_button("Apply Filter")
         
-        if st.sidebar.button("Clear Filter"):
-            st.session_state.filter_column = None
-            st.session_state.filter_value = ""
+        if applied:
+            st.session_state.filter_column = filter_column
+            st.session_state.filter_value = filter_value if filter_column else ""
             reset_to_first_page()
-            st.rerun()
-        
-        st.sidebar.markdown("---")
         
-        # Settings
-        st.sidebar.subheader("Settings")
-        with st.sidebar.expander("Performance Settings"):
-            st.session_state.max_rows_full_load = st.number_input(
-                "Max rows for full load",
-                min_value=1000,
-                max_value=1000000,
-                value=st.session_state.max_rows_full_load,
-                step=10000,
-                help="Files with fewer rows than this will be loaded entirely into memory"
-            )
-            
-            st.caption("Changes apply to the next file upload")
+        st.sidebar.button("Clear Filter", on_click=clear_filter)
 
 
 def render_schema_tab(parquet_file: pq.ParquetFile):
     """Render the schema tab content."""
     st.subheader("Schema Information")
     
-    schema_df = get_schema_dataframe(parquet_file)
+    schema_df = get_schema_dataframe(st.session_state.file_digest, parquet_file)
     st.dataframe(schema_df, use_container_width=True, hide_index=True)
     
     st.info(f"Total columns: {len(schema_df)}")
@@ -318,7 +615,11 @@ def render_metadata_tab(parquet_file: pq.ParquetFile):
     """Render the metadata tab content."""
     st.subheader("File Metadata")
     
-    metadata = get_metadata_dict(parquet_file)
+    metadata = get_metadata_dict(
+        st.session_state.file_digest,
+        parquet_file,
+        st.session_state.total_byte_size
+    )
     
     # Display metadata in columns
     cols = st.columns(2)
@@ -327,12 +628,23 @@ def render_metadata_tab(parquet_file: pq.ParquetFile):
             st.metric(label=key, value=value)
 
 
-def render_data_tab(parquet_file: pq.ParquetFile):
-    """Render the data tab content with efficient pagination."""
+@st.fragment
+def render_data_tab():
+    """
+    Render the data tab content with efficient pagination.
+    
+    Runs as a fragment, so paging only reruns this tab and not the sidebar
+    or the other tabs.
+    """
     st.subheader("Data View")
     
+    filter_active = (
+        st.session_state.filter_column in st.session_state.columns
+        and bool(st.session_state.filter_value)
+    )
+    
     # Show filter status
-    if st.session_state.filter_column:
+    if filter_active:
         st.info(f"Filter active: {st.session_state.filter_column} contains '{st.session_state.filter_value}'")
     
     # Pagination controls
@@ -359,50 +671,62 @@ def render_data_tab(parquet_file: pq.ParquetFile):
     with col3:
         if st.button("Previous Page", disabled=(current_page <= 1)):
             st.session_state.current_page = max(1, current_page - 1)
-            st.rerun()
+            st.rerun(scope="fragment")
     
     with col4:
         if st.button("Next Page", disabled=(current_page >= total_pages)):
             st.session_state.current_page = min(total_pages, current_page + 1)
-            st.rerun()
+            st.rerun(scope="fragment")
     
     # Read data efficiently
     with st.spinner("Loading data..."):
-        if st.session_state.filter_column and st.session_state.filter_value:
-            # When filtering, we need to load more data to find matches
+        if filter_active:
+            # When filtering, we need to scan the file to find matches
             # For large files, this is a limitation - we scan row groups
-            st.warning("Filtering loads data into memory. For very large files, this may be slow.")
+            st.warning("Filtering scans the whole file. For very large files, this may be slow.")
             
-            # Read all data and filter (for filtered view)
-            table = parquet_file.read(columns=st.session_state.selected_columns)
-            df = table.to_pandas()
+            selected_columns = st.session_state.selected_columns
+            try:
+                table = filter_table(
+                    st.session_state.file_digest,
+                    st.session_state.file_path,
+                    st.session_state.filter_column,
+                    st.session_state.filter_value,
+                    columns=tuple(selected_columns) if selected_columns else None,
+                    _row_group_offsets=st.session_state.row_group_offsets
+                )
+            except ValueError as e:
+                st.warning(str(e))
+                return
             
-            col = st.session_state.filter_column
-            val = st.session_state.filter_value
-            if df[col].dtype == "object":
-                df = df[df[col].astype(str).str.contains(val, case=False, na=False)]
-            else:
-                df = df[df[col].astype(str) == val]
-            
-            # Paginate the filtered results
-            paginated_df, total_filtered_pages = paginate_dataframe(df, current_page, page_size)
+            # Paginate the filtered results without leaving Arrow
+            paginated_table, total_filtered_pages = paginate_table(table, current_page, page_size)
             st.session_state.current_page = min(current_page, total_filtered_pages)
             
             # Display data
-            st.dataframe(paginated_df, use_container_width=True, hide_index=True)
-            st.caption(f"Showing {len(paginated_df)} of {len(df)} filtered rows (total in file: {total_rows:,})")
+            st.dataframe(paginated_table, use_container_width=True, hide_index=True)
+            st.caption(f"Showing {paginated_table.num_rows} of {table.num_rows:,} filtered rows (total in file: {total_rows:,})")
         else:
             # No filter - use efficient row-based reading
-            df = read_page_efficiently(
-                parquet_file,
-                current_page,
-                page_size,
-                columns=st.session_state.selected_columns
-            )
+            selected_columns = st.session_state.selected_columns
+            # Errors are handled here rather than in the cached reader, so a
+            # failed read isn't cached as an empty page
+            try:
+                page_table = read_page_efficiently(
+                    st.session_state.file_digest,
+                    st.session_state.file_path,
+                    current_page,
+                    page_size,
+                    columns=tuple(selected_columns) if selected_columns else None,
+                    _row_group_offsets=st.session_state.row_group_offsets
+                )
+            except Exception as e:
+                st.error(f"Error reading page: {str(e)}")
+                return
             
             # Display data
-            st.dataframe(df, use_container_width=True, hide_index=True)
-            st.caption(f"Showing {len(df)} rows (total in file: {total_rows:,})")
+            st.dataframe(page_table, use_container_width=True, hide_index=True)
+            st.caption(f"Showing {page_table.num_rows} rows (total in file: {total_rows:,})")
 
 
 def main():
@@ -416,18 +740,19 @@ def main():
     render_sidebar()
     
     # Main content
-    if st.session_state.parquet_file is not None:
+    parquet_file = get_active_parquet_file()
+    if parquet_file is not None:
         # Create tabs - Data first as it's the most used
         tab_data, tab_schema, tab_metadata = st.tabs(["Data", "Schema", "Metadata"])
         
         with tab_data:
-            render_data_tab(st.session_state.parquet_file)
+            render_data_tab()
         
         with tab_schema:
-            render_schema_tab(st.session_state.parquet_file)
+            render_schema_tab(parquet_file)
         
         with tab_metadata:
-            render_metadata_tab(st.session_state.parquet_file)
+            render_metadata_tab(parquet_file)
     else:
         st.info("Please upload a Parquet file using the sidebar to get started.")
 